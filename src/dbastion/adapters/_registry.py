@@ -22,6 +22,10 @@ _EXTRAS: dict[DatabaseType, str] = {
     DatabaseType.SNOWFLAKE: "snowflake",
 }
 
+# Resolved adapter classes, keyed by (module path, class name). Failed imports
+# are not cached, so installing a driver mid-process is picked up.
+_RESOLVED: dict[tuple[str, str], type[DatabaseAdapter]] = {}
+
 
 def get_adapter(db_type: DatabaseType) -> type[DatabaseAdapter]:
     """Lazy-load an adapter class by database type.
@@ -32,6 +36,10 @@ def get_adapter(db_type: DatabaseType) -> type[DatabaseAdapter]:
     if entry is None:
         raise AdapterError(f"No adapter registered for {db_type.value}")
 
+    cls = _RESOLVED.get(entry)
+    if cls is not None:
+        return cls
+
     module_path, class_name = entry
     try:
         mod = importlib.import_module(module_path)
@@ -42,4 +50,5 @@ def get_adapter(db_type: DatabaseType) -> type[DatabaseAdapter]:
             f"Install with: pip install 'dbastion[{extra}]'"
         ) from e
 
-    return getattr(mod, class_name)
+    cls = _RESOLVED[entry] = getattr(mod, class_name)
+    return cls
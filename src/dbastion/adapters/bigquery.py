@@ -95,14 +95,12 @@ class BigQueryAdapter:
         try:
             query_job = client.query(sql, job_config=job_config)
             result_iter = query_job.result()
-            rows = list(result_iter)
+            columns = [field.name for field in result_iter.schema] if result_iter.schema else []
+            result_rows = [dict(row.items()) for row in result_iter]
         except Exception as e:
             raise AdapterError(f"BigQuery execution failed: {e}") from e
         duration_ms = (time.monotonic() - t0) * 1000
 
-        columns = [field.name for field in result_iter.schema] if result_iter.schema else []
-        result_rows = [dict(row.items()) for row in rows]
-
         cost = None
         total_bytes = query_job.total_bytes_processed
         if total_bytes is not None:
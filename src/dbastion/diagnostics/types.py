@@ -174,9 +174,9 @@ class DiagnosticResult:
 def apply_fixes(sql: str, diagnostics: list[Diagnostic]) -> str | None:
     """Apply all MachineApplicable suggestions to the SQL string.
 
-    Suggestions are applied in reverse byte-offset order so that earlier
-    spans remain valid after later replacements. Returns None if no fixes
-    were applied.
+    Suggestions are sorted by offset and spliced in a single pass over the
+    original string, so k fixes cost one join instead of k string copies.
+    Returns None if no fixes were applied or if any spans overlap.
     """
     parts: list[SubstitutionPart] = [
         part
@@ -188,17 +188,19 @@ def apply_fixes(sql: str, diagnostics: list[Diagnostic]) -> str | None:
     if not parts:
         return None
 
-    # Sort by start offset descending — apply from end to start.
-    parts.sort(key=lambda p: p.span.start, reverse=True)
+    # Among parts sharing a start offset the later one is emitted first,
+    # as when fixes were applied back to front.
+    order = sorted(range(len(parts)), key=lambda i: (parts[i].span.start, -i))
 
-    # Check for overlapping spans.
-    for i in range(len(parts) - 1):
-        # parts[i] has later start (sorted descending).
-        if parts[i + 1].span.end > parts[i].span.start:
+    chunks: list[str] = []
+    cursor = 0
+    for part in (parts[i] for i in order):
+        # Overlapping spans — bail out rather than corrupt the SQL.
+        if part.span.start < cursor:
             return None
+        chunks.append(sql[cursor : part.span.start])
+        chunks.append(part.replacement)
+        cursor = part.span.end
+    chunks.append(sql[cursor:])
 
-    result = sql
-    for part in parts:
-        result = result[: part.span.start] + part.replacement + result[part.span.end :]
-
-    return result
+    return "".join(chunks)
@@ -17,6 +17,8 @@ def inject_limit(
     """Add LIMIT to unbounded SELECT statements.
 
     Returns the (possibly modified) statement and an optional info diagnostic.
+    The statement is modified in place — callers own the AST and must not
+    rely on the original being preserved.
     Does NOT add LIMIT if:
     - Statement is not a SELECT
     - LIMIT already present
@@ -29,7 +31,7 @@ def inject_limit(
     if statement.find(exp.Group) is not None:
         return statement, None
 
-    modified = statement.limit(limit)
+    modified = statement.limit(limit, copy=False)
     diag = (
         Diagnostic.info(codes.LIMIT_INJECTED, f"LIMIT {limit} added to unbounded SELECT")
         .note("override with --limit N (0 to disable)")
@@ -10,6 +10,10 @@ from dbastion.diagnostics import Diagnostic, Span, codes
 
 def check_multiple_statements(sql: str) -> Diagnostic | None:
     """Block SQL containing multiple statements (possible injection)."""
+    # sqlglot only splits statements on semicolons — skip the parse without one.
+    if ";" not in sql:
+        return None
+
     try:
         statements = sqlglot.parse(sql)
     except sqlglot.errors.SqlglotError:
@@ -21,9 +25,6 @@ def check_multiple_statements(sql: str) -> Diagnostic | None:
         return None
 
     semi_pos = sql.find(";")
-    if semi_pos == -1:
-        semi_pos = len(sql) // 2
-
     return (
         Diagnostic.error(codes.MULTIPLE_STATEMENTS, "multiple statements detected")
         .span(Span(semi_pos, semi_pos + 1), "second statement starts here")
@@ -32,6 +33,22 @@ def check_multiple_statements(sql: str) -> Diagnostic | None:
     )
 
 
+# Built-in function class -> SQL name. sql_name() depends only on the class,
+# so resolve it once per type instead of once per call site.
+_FUNC_NAMES: dict[type[exp.Func], str] = {}
+
+
+def _function_name(func: exp.Func) -> str:
+    """Return the SQL-level name of a function call node."""
+    if isinstance(func, exp.Anonymous):
+        return func.name
+    cls = type(func)
+    name = _FUNC_NAMES.get(cls)
+    if name is None:
+        name = _FUNC_NAMES[cls] = cls.sql_name()
+    return name
+
+
 def check_dangerous_functions(
     statement: exp.Expression,
     sql: str,
@@ -41,15 +58,8 @@ def check_dangerous_functions(
     if not blocked_functions:
         return None
 
-    for func in statement.find_all(exp.Anonymous, exp.Func):
-        name = ""
-        if isinstance(func, exp.Anonymous):
-            name = func.name
-        elif hasattr(func, "sql_name"):
-            name = func.sql_name()
-        elif hasattr(func, "key"):
-            name = func.key
-
+    for func in statement.find_all(exp.Func):
+        name = _function_name(func)
         if name.lower() in blocked_functions:
             return Diagnostic.error(
                 codes.DANGEROUS_FUNCTION,
@@ -85,24 +95,34 @@ def _relation_identifiers(relation: exp.Expression) -> set[str]:
 
 def _table_refs(node: exp.Expression) -> set[str]:
     """Collect qualified table names referenced by columns in an expression."""
+    # Fast path for the common `a.x = b.y` shape: read both sides directly
+    # instead of walking the tree.
+    left = node.args.get("this")
+    right = node.args.get("expression")
+    if isinstance(left, exp.Column) and isinstance(right, exp.Column):
+        return {table.lower() for table in (left.table, right.table) if table}
     return {c.table.lower() for c in node.find_all(exp.Column) if c.table}
 
 
+def _where_predicate_refs(where_expr: exp.Where | None) -> list[set[str]]:
+    """Collect the table refs of every comparison predicate in WHERE, once per SELECT."""
+    if where_expr is None:
+        return []
+    return [
+        refs
+        for predicate in where_expr.find_all(*_JOIN_PREDICATE_TYPES)
+        if (refs := _table_refs(predicate))
+    ]
+
+
 def _where_links_tables(
-    where_expr: exp.Where | None,
+    predicate_refs: list[set[str]],
     *,
     left_ids: set[str],
     right_ids: set[str],
 ) -> bool:
-    """Return True if WHERE contains a predicate linking left and right relations."""
-    if where_expr is None:
-        return False
-
-    for predicate in where_expr.find_all(*_JOIN_PREDICATE_TYPES):
-        refs = _table_refs(predicate)
-        if refs & left_ids and refs & right_ids:
-            return True
-    return False
+    """Return True if a WHERE predicate links left and right relations."""
+    return any(refs & left_ids and refs & right_ids for refs in predicate_refs)
 
 
 def check_cross_join_no_condition(statement: exp.Expression, sql: str) -> Diagnostic | None:
@@ -112,25 +132,25 @@ def check_cross_join_no_condition(statement: exp.Expression, sql: str) -> Diagno
         if from_clause is None or from_clause.this is None:
             continue
 
-        where_expr = select.args.get("where")
+        predicate_refs = _where_predicate_refs(select.args.get("where"))
         left_ids = _relation_identifiers(from_clause.this)
 
         for join in select.args.get("joins") or []:
             right_ids = _relation_identifiers(join.this)
+            # sqlglot stores join keywords upper-cased, so compare directly.
             is_explicit_cross = (
-                str(join.args.get("kind") or "").upper() == "CROSS"
-                or str(join.args.get("side") or "").upper() == "CROSS"
+                join.args.get("kind") == "CROSS" or join.args.get("side") == "CROSS"
             )
             has_on_using = (
                 join.args.get("on") is not None
                 or join.args.get("using") is not None
-                or str(join.args.get("method") or "").upper() == "NATURAL"
+                or join.args.get("method") == "NATURAL"
             )
 
             # Explicit CROSS JOIN — still allow if WHERE links the tables
             # (BigQuery parses `FROM a, b` as CROSS JOIN even with a linking WHERE).
             if is_explicit_cross and not _where_links_tables(
-                where_expr, left_ids=left_ids, right_ids=right_ids,
+                predicate_refs, left_ids=left_ids, right_ids=right_ids,
             ):
                 return Diagnostic.warning(
                     codes.CROSS_JOIN_NO_CONDITION,
@@ -139,7 +159,7 @@ def check_cross_join_no_condition(statement: exp.Expression, sql: str) -> Diagno
 
             # Implicit join is only allowed if WHERE contains a relation-link predicate.
             if not is_explicit_cross and not has_on_using and not _where_links_tables(
-                where_expr, left_ids=left_ids, right_ids=right_ids,
+                predicate_refs, left_ids=left_ids, right_ids=right_ids,
             ):
                 return Diagnostic.warning(
                     codes.CROSS_JOIN_NO_CONDITION,
@@ -14,6 +14,9 @@ def extract_tables(statement: exp.Expression) -> list[str]:
 
     Returns sorted list of fully-qualified table names (schema.table when schema is present).
     """
+    if _is_flat(statement):
+        return _walk_tables(statement)
+
     cte_names: set[str] = set()
     source_tables: set[str] = set()
 
@@ -35,7 +38,9 @@ def extract_tables(statement: exp.Expression) -> list[str]:
     # Pass 2: collect real tables from all scopes
     for scope in scopes:
         for table in scope.tables:
-            if table.name not in cte_names:
+            # Table-valued functions (read_csv(...), generate_series(...))
+            # appear as unnamed tables; they aren't physical tables.
+            if table.name and table.name not in cte_names:
                 source_tables.add(_qualified_name(table))
 
     # Pass 3: DML targets (INSERT INTO, DELETE FROM, UPDATE) aren't in scopes
@@ -43,12 +48,24 @@ def extract_tables(statement: exp.Expression) -> list[str]:
     for node in (statement.find(t) for t in dml_types):
         if node is not None:
             table = node.find(exp.Table)
-            if table is not None and table.name not in cte_names:
+            if table is not None and table.name and table.name not in cte_names:
                 source_tables.add(_qualified_name(table))
 
     return sorted(source_tables)
 
 
+def _is_flat(statement: exp.Expression) -> bool:
+    """True when the statement has no CTEs, subqueries, or nested queries.
+
+    Such statements have a single scope whose tables are exactly the Table
+    nodes in the tree, so scope analysis can be skipped.
+    """
+    return all(
+        node is statement
+        for node in statement.find_all(exp.Query, exp.With, exp.Subquery)
+    )
+
+
 def _walk_tables(statement: exp.Expression) -> list[str]:
     """Simple AST walk fallback for DDL and other non-scoped statements."""
     tables: set[str] = set()
@@ -5,12 +5,18 @@ from __future__ import annotations
 import contextlib
 import json
 import os
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
 
 DEFAULT_RETENTION_DAYS = 30
 _LOG_ROOT = Path.home() / ".dbastion" / "logs"
 
+# json.dumps() builds a fresh encoder whenever non-default options are passed.
+_ENCODER = json.JSONEncoder(default=str)
+
+# (utc day ordinal, log root, cwd) -> today's log file.
+_today_cache: tuple[tuple[int, Path, str], Path] | None = None
+
 
 def _project_slug() -> str:
     """Encode cwd into a directory-safe slug, matching Claude Code's convention."""
@@ -24,9 +30,16 @@ def _log_dir() -> Path:
 
 
 def _today_file() -> Path:
-    """Return today's log file path."""
-    today = datetime.now(UTC).strftime("%Y-%m-%d")
-    return _log_dir() / f"{today}.jsonl"
+    """Return today's log file path, rebuilt only when the date, root or cwd changes."""
+    global _today_cache
+    now = datetime.now(UTC)
+    key = (now.toordinal(), _LOG_ROOT, os.getcwd())
+    cached = _today_cache
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    path = _LOG_ROOT / _project_slug() / f"{now:%Y-%m-%d}.jsonl"
+    _today_cache = (key, path)
+    return path
 
 
 def log_query(
@@ -62,34 +75,51 @@ def log_query(
         "duration_ms": duration_ms,
         "labels": labels,
     }
+    line = _ENCODER.encode(entry).encode() + b"\n"
 
     try:
         log_file = _today_file()
         log_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(log_file, "a") as f:
-            f.write(json.dumps(entry, default=str) + "\n")
+        with open(log_file, "ab") as f:
+            f.write(line)
     except OSError:
         pass  # Logging should never crash the query pipeline
 
 
+def _is_log_date(stem: str) -> bool:
+    """True when a filename stem is a valid YYYY-MM-DD date."""
+    # fromisoformat also takes forms like 20240101 and 2024-W01-1; the
+    # round-trip keeps only the calendar form the filenames use.
+    try:
+        return date.fromisoformat(stem).isoformat() == stem
+    except ValueError:
+        return False
+
+
 def cleanup_old_logs(*, retention_days: int = DEFAULT_RETENTION_DAYS) -> int:
     """Delete log files older than retention_days. Returns count of deleted files."""
-    cutoff = datetime.now(UTC) - timedelta(days=retention_days)
+    # ISO dates sort lexicographically, so filenames compare directly against
+    # the cutoff day. A file dated on the cutoff day starts before the cutoff
+    # instant, hence <=.
+    cutoff = (datetime.now(UTC) - timedelta(days=retention_days)).strftime("%Y-%m-%d")
     deleted = 0
 
     log_dir = _log_dir()
-    if not log_dir.exists():
+    try:
+        entries = os.scandir(log_dir)
+    except OSError:
         return 0
 
-    for log_file in log_dir.glob("*.jsonl"):
-        # Parse date from filename (YYYY-MM-DD.jsonl)
-        try:
-            file_date = datetime.strptime(log_file.stem, "%Y-%m-%d").replace(tzinfo=UTC)
-        except ValueError:
-            continue
-        if file_date < cutoff:
-            log_file.unlink()
-            deleted += 1
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if not name.endswith(".jsonl"):
+                continue
+            stem = name[:-6]
+            if _is_log_date(stem) and stem <= cutoff:
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(entry.path)
+                    deleted += 1
 
     # Remove empty project directories
     with contextlib.suppress(OSError):
@@ -6,6 +6,7 @@ import asyncio
 import os
 
 import pytest
+import pytest_asyncio
 
 POSTGRES_DSN = os.environ.get(
     "DBASTION_POSTGRES_DSN",
@@ -25,8 +26,8 @@ def pg_dsn():
     return POSTGRES_DSN
 
 
-@pytest.fixture
-def postgres_adapter(pg_dsn):
+@pytest_asyncio.fixture(loop_scope="session")
+async def postgres_adapter(pg_dsn):
     """Connected PostgresAdapter, tears down after each test."""
     from dbastion.adapters._base import ConnectionConfig, DatabaseType
     from dbastion.adapters.postgres import PostgresAdapter
@@ -37,9 +38,9 @@ def postgres_adapter(pg_dsn):
         db_type=DatabaseType.POSTGRES,
         params={"dsn": pg_dsn},
     )
-    asyncio.run(adapter.connect(config))
+    await adapter.connect(config)
     yield adapter
-    asyncio.run(adapter.close())
+    await adapter.close()
 
 
 @pytest.fixture(scope="session")
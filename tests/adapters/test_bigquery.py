@@ -2,123 +2,93 @@
 
 from __future__ import annotations
 
-import asyncio
 import datetime
 import json
+from dataclasses import dataclass, field
+from types import SimpleNamespace
 
 import pytest
 
 pytest.importorskip("google.cloud.bigquery")
 
+from google.cloud.bigquery.table import Row
+
 from dbastion.adapters._base import AdapterError, CostUnit
 from dbastion.adapters.bigquery import BigQueryAdapter
 
 
+@dataclass(slots=True, frozen=True)
 class _Field:
-    def __init__(
-        self,
-        name: str,
-        field_type: str = "STRING",
-        mode: str = "NULLABLE",
-        description: str | None = None,
-    ) -> None:
-        self.name = name
-        self.field_type = field_type
-        self.mode = mode
-        self.description = description
+    name: str
+    field_type: str = "STRING"
+    mode: str = "NULLABLE"
+    description: str | None = None
+
+
+def _row(**values: object) -> Row:
+    """Build a real BigQuery Row with the given column order and values."""
+    return Row(tuple(values.values()), {name: i for i, name in enumerate(values)})
 
 
+@dataclass(slots=True)
 class _ResultIter:
-    def __init__(self, rows: list[dict[str, object]], schema: list[_Field]) -> None:
-        self._rows = rows
-        self.schema = schema
+    rows: list[Row]
+    schema: list[_Field]
 
     def __iter__(self):
-        return iter(self._rows)
+        return iter(self.rows)
 
 
+@dataclass(slots=True, kw_only=True)
 class _QueryJob:
-    def __init__(
-        self,
-        *,
-        rows: list[dict[str, object]],
-        result_schema: list[_Field],
-        total_bytes_processed: int,
-        job_schema: list[_Field] | None,
-    ) -> None:
-        self._result_iter = _ResultIter(rows, result_schema)
-        self.total_bytes_processed = total_bytes_processed
-        # Intentionally separate from result_iter schema to catch regressions.
-        self.schema = job_schema
+    rows: list[Row]
+    result_schema: list[_Field]
+    total_bytes_processed: int
+    # Intentionally separate from result_schema to catch regressions.
+    schema: list[_Field] | None = None
 
     def result(self) -> _ResultIter:
-        return self._result_iter
-
-
-class _Dataset:
-    def __init__(self, dataset_id: str) -> None:
-        self.dataset_id = dataset_id
-
-
-class _TableListItem:
-    def __init__(self, table_id: str) -> None:
-        self.table_id = table_id
-
-
-class _TimePartitioning:
-    def __init__(self, type_: str, field: str | None = None) -> None:
-        self.type_ = type_
-        self.field = field
+        return _ResultIter(self.rows, self.result_schema)
 
 
+@dataclass(slots=True, kw_only=True)
 class _Table:
-    def __init__(
-        self,
-        *,
-        dataset_id: str,
-        table_id: str,
-        schema: list[_Field],
-        num_rows: int = 0,
-        time_partitioning: _TimePartitioning | None = None,
-        clustering_fields: list[str] | None = None,
-        created: datetime.datetime | None = None,
-        modified: datetime.datetime | None = None,
-        num_bytes: int | None = None,
-    ) -> None:
-        self.dataset_id = dataset_id
-        self.table_id = table_id
-        self.schema = schema
-        self.num_rows = num_rows
-        self.time_partitioning = time_partitioning
-        self.clustering_fields = clustering_fields
-        self.created = created
-        self.modified = modified
-        self.num_bytes = num_bytes
-
-
+    dataset_id: str
+    table_id: str
+    schema: list[_Field]
+    num_rows: int = 0
+    time_partitioning: SimpleNamespace | None = None
+    clustering_fields: list[str] | None = None
+    created: datetime.datetime | None = None
+    modified: datetime.datetime | None = None
+    num_bytes: int | None = None
+
+
+@dataclass(slots=True)
 class _Client:
-    def __init__(self, query_job: _QueryJob | None = None) -> None:
-        self._query_job = query_job
-        self.calls: list[tuple[str, object | None]] = []
-        self._datasets: list[_Dataset] = []
-        self._tables: dict[str, list[_TableListItem]] = {}
-        self._table_details: dict[str, _Table] = {}
+    _query_job: _QueryJob | None = None
+    calls: list[tuple[str, object | None]] = field(default_factory=list)
+    _datasets: list[SimpleNamespace] = field(default_factory=list)
+    _tables: dict[str, list[SimpleNamespace]] = field(default_factory=dict)
+    _table_details: dict[tuple[str, str], _Table] = field(default_factory=dict)
 
     def query(self, sql: str, job_config=None) -> _QueryJob:
         self.calls.append((sql, job_config))
         assert self._query_job is not None
         return self._query_job
 
-    def list_datasets(self) -> list[_Dataset]:
+    def list_datasets(self) -> list[SimpleNamespace]:
         return self._datasets
 
-    def list_tables(self, dataset: str) -> list[_TableListItem]:
+    def list_tables(self, dataset: str) -> list[SimpleNamespace]:
         return self._tables.get(dataset, [])
 
     def get_table(self, ref: str) -> _Table:
-        if ref not in self._table_details:
-            raise Exception(f"Not found: {ref}")
-        return self._table_details[ref]
+        dataset, _, table = ref.partition(".")
+        try:
+            return self._table_details[dataset, table]
+        except KeyError:
+            raise Exception(f"Not found: {ref}") from None
 
     def close(self) -> None:
         return None
@@ -168,18 +138,19 @@ def test_ml_predict_not_blocked_by_policy() -> None:
 # -- execute --
 
 
-def test_execute_uses_result_iter_schema_not_query_job_schema() -> None:
+@pytest.mark.asyncio(loop_scope="session")
+async def test_execute_uses_result_iter_schema_not_query_job_schema() -> None:
     query_job = _QueryJob(
-        rows=[{"x": 1}],
+        rows=[_row(x=1)],
         result_schema=[_Field("x")],
         total_bytes_processed=1024**3,
-        job_schema=None,  # Old bug: reading this made columns empty.
+        schema=None,  # Old bug: reading this made columns empty.
     )
     client = _Client(query_job)
     adapter = BigQueryAdapter()
     adapter._client = client  # noqa: SLF001 - test-only injection
 
-    result = asyncio.run(adapter.execute("SELECT 1"))
+    result = await adapter.execute("SELECT 1")
 
     assert result.columns == ["x"]
     assert result.row_count == 1
@@ -190,18 +161,64 @@ def test_execute_uses_result_iter_schema_not_query_job_schema() -> None:
     assert result.cost.estimated_gb > 0
 
 
-def test_execute_passes_labels_to_query_job_config() -> None:
+@pytest.mark.asyncio(loop_scope="session")
+async def test_execute_maps_row_values_to_columns() -> None:
+    query_job = _QueryJob(
+        rows=[_row(id=1, name="alice"), _row(id=2, name="bob")],
+        result_schema=[_Field("id", "INTEGER"), _Field("name")],
+        total_bytes_processed=0,
+    )
+    adapter = _make_adapter(_Client(query_job))
+
+    result = await adapter.execute("SELECT id, name FROM users")
+
+    assert result.columns == ["id", "name"]
+    assert result.rows == [{"id": 1, "name": "alice"}, {"id": 2, "name": "bob"}]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_execute_empty_schema_keeps_row_data() -> None:
+    query_job = _QueryJob(
+        rows=[_row(x=1)],
+        result_schema=[],
+        total_bytes_processed=0,
+    )
+    adapter = _make_adapter(_Client(query_job))
+
+    result = await adapter.execute("SELECT 1 AS x")
+
+    assert result.columns == []
+    assert result.rows == [{"x": 1}]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_execute_row_wider_than_schema_keeps_all_values() -> None:
+    query_job = _QueryJob(
+        rows=[_row(id=1, name="alice")],
+        result_schema=[_Field("id", "INTEGER")],
+        total_bytes_processed=0,
+    )
+    adapter = _make_adapter(_Client(query_job))
+
+    result = await adapter.execute("SELECT id, name FROM users")
+
+    assert result.columns == ["id"]
+    assert result.rows == [{"id": 1, "name": "alice"}]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_execute_passes_labels_to_query_job_config() -> None:
     query_job = _QueryJob(
-        rows=[{"value": 7}],
+        rows=[_row(value=7)],
         result_schema=[_Field("value")],
         total_bytes_processed=0,
-        job_schema=None,
+        schema=None,
     )
     client = _Client(query_job)
     adapter = BigQueryAdapter()
     adapter._client = client  # noqa: SLF001 - test-only injection
 
-    asyncio.run(adapter.execute("SELECT 7 AS value", labels={"tool": "test"}))
+    await adapter.execute("SELECT 7 AS value", labels={"tool": "test"})
 
     assert len(client.calls) == 1
     _, job_config = client.calls[0]
@@ -218,32 +235,38 @@ def _make_adapter(client: _Client) -> BigQueryAdapter:
     return adapter
 
 
-def test_list_schemas() -> None:
+@pytest.mark.asyncio(loop_scope="session")
+async def test_list_schemas() -> None:
     client = _Client()
-    client._datasets = [_Dataset("users"), _Dataset("events")]
+    client._datasets = [SimpleNamespace(dataset_id="users"), SimpleNamespace(dataset_id="events")]
     adapter = _make_adapter(client)
 
-    schemas = asyncio.run(adapter.list_schemas())
+    schemas = await adapter.list_schemas()
     assert schemas == ["users", "events"]
 
 
-def test_list_tables() -> None:
+@pytest.mark.asyncio(loop_scope="session")
+async def test_list_tables() -> None:
     client = _Client()
-    client._tables["users"] = [_TableListItem("profiles"), _TableListItem("sessions")]
+    client._tables["users"] = [
+        SimpleNamespace(table_id="profiles"),
+        SimpleNamespace(table_id="sessions"),
+    ]
     adapter = _make_adapter(client)
 
-    tables = asyncio.run(adapter.list_tables("users"))
+    tables = await adapter.list_tables("users")
     assert len(tables) == 2
     assert tables[0].name == "profiles"
     assert tables[0].schema == "users"
     assert tables[1].name == "sessions"
 
 
-def test_describe_table_with_full_metadata() -> None:
+@pytest.mark.asyncio(loop_scope="session")
+async def test_describe_table_with_full_metadata() -> None:
     created = datetime.datetime(2025, 5, 12, 11, 0, 0, tzinfo=datetime.UTC)
     modified = datetime.datetime(2026, 3, 1, 14, 0, 0, tzinfo=datetime.UTC)
     client = _Client()
-    client._table_details["users.events"] = _Table(
+    client._table_details["users", "events"] = _Table(
         dataset_id="users",
         table_id="events",
         schema=[
@@ -251,7 +274,7 @@ def test_describe_table_with_full_metadata() -> None:
             _Field("event_type", "STRING", "NULLABLE", description="Type of event"),
         ],
         num_rows=1_000_000,
-        time_partitioning=_TimePartitioning("DAY", "ts"),
+        time_partitioning=SimpleNamespace(type_="DAY", field="ts"),
         clustering_fields=["event_type"],
         created=created,
         modified=modified,
@@ -259,7 +282,7 @@ def test_describe_table_with_full_metadata() -> None:
     )
     adapter = _make_adapter(client)
 
-    info = asyncio.run(adapter.describe_table("events", schema="users"))
+    info = await adapter.describe_table("events", schema="users")
 
     assert info.schema == "users"
     assert info.name == "events"
@@ -282,9 +305,10 @@ def test_describe_table_with_full_metadata() -> None:
     json.dumps(meta)
 
 
-def test_describe_table_plain_no_extra_metadata() -> None:
+@pytest.mark.asyncio(loop_scope="session")
+async def test_describe_table_plain_no_extra_metadata() -> None:
     client = _Client()
-    client._table_details["users.simple"] = _Table(
+    client._table_details["users", "simple"] = _Table(
         dataset_id="users",
         table_id="simple",
         schema=[_Field("id", "INTEGER", "REQUIRED")],
@@ -297,14 +321,15 @@ def test_describe_table_plain_no_extra_metadata() -> None:
     )
     adapter = _make_adapter(client)
 
-    info = asyncio.run(adapter.describe_table("simple", schema="users"))
+    info = await adapter.describe_table("simple", schema="users")
 
     assert info.metadata == {}
     json.dumps(info.metadata)
 
 
-def test_describe_table_requires_schema() -> None:
+@pytest.mark.asyncio(loop_scope="session")
+async def test_describe_table_requires_schema() -> None:
     adapter = BigQueryAdapter()
     adapter._client = _Client()  # noqa: SLF001
     with pytest.raises(AdapterError, match="requires a dataset name"):
-        asyncio.run(adapter.describe_table("events"))
+        await adapter.describe_table("events")
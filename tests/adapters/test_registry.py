@@ -10,6 +10,10 @@ def test_get_duckdb_adapter():
     assert cls.__name__ == "DuckDBAdapter"
 
 
+def test_get_adapter_is_cached():
+    assert get_adapter(DatabaseType.DUCKDB) is get_adapter(DatabaseType.DUCKDB)
+
+
 def test_get_bigquery_adapter():
     """BigQuery adapter class can be loaded (google-cloud-bigquery may or may not be installed)."""
     try:
@@ -56,5 +60,6 @@ def test_missing_driver_has_install_hint():
     # but we test the message format by checking the registry mapping exists.
     from dbastion.adapters._registry import _ADAPTER_MAP, _EXTRAS
 
-    for db_type in _ADAPTER_MAP:
-        assert db_type in _EXTRAS
+    assert _ADAPTER_MAP.keys() <= _EXTRAS.keys()
+    # Bare extra names; the error message wraps them as dbastion[<extra>].
+    assert all(extra.isidentifier() for extra in _EXTRAS.values())
@@ -0,0 +1,123 @@
+"""CLI test fixtures."""
+
+from __future__ import annotations
+
+import json
+import shutil
+from collections.abc import Callable
+
+import pytest
+from click.testing import Result
+
+from dbastion.cli import main
+
+
+@pytest.fixture
+def invoke(cli_runner) -> Callable[..., Result]:
+    """Invoke the `dbastion` CLI, letting unexpected exceptions propagate."""
+
+    def _invoke(args: list[str], **kwargs) -> Result:
+        return cli_runner.invoke(main, args, catch_exceptions=False, **kwargs)
+
+    return _invoke
+
+
+@pytest.fixture
+def invoke_json(invoke) -> Callable[..., tuple[Result, dict]]:
+    """Like `invoke`, also parsing the command's output as JSON."""
+
+    def _invoke_json(args: list[str], **kwargs) -> tuple[Result, dict]:
+        result = invoke(args, **kwargs)
+        return result, json.loads(result.output)
+
+    return _invoke_json
+
+
+@pytest.fixture(scope="session")
+def duckdb_mod():
+    """The duckdb module, imported on first use; skips when the extra is missing."""
+    return pytest.importorskip("duckdb")
+
+
+@pytest.fixture(scope="session")
+def duckdb_fixture_path(duckdb_mod, tmp_path_factory) -> str:
+    """DuckDB file with test tables, built once per session. Treat as read-only."""
+    path = tmp_path_factory.mktemp("db") / "fixture.duckdb"
+    conn = duckdb_mod.connect(str(path))
+    conn.execute("""
+        CREATE SCHEMA analytics;
+        CREATE TABLE main.users (id INTEGER, name VARCHAR, active BOOLEAN);
+        INSERT INTO main.users VALUES (1, 'alice', true);
+        CREATE TABLE analytics.events (ts TIMESTAMP, event_type VARCHAR);
+    """)
+    conn.close()
+    return str(path)
+
+
+@pytest.fixture
+def duckdb_db(duckdb_fixture_path, tmp_path) -> str:
+    """Writable per-test copy of the fixture database."""
+    path = tmp_path / "test.duckdb"
+    shutil.copyfile(duckdb_fixture_path, path)
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def _shared_memory_db(duckdb_mod):
+    conn = duckdb_mod.connect(":memory:")
+    conn.execute("""
+        CREATE TABLE users (id INTEGER, name TEXT);
+        INSERT INTO users VALUES (1, 'alice');
+    """)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def shared_duckdb(_shared_memory_db, monkeypatch):
+    """Serve `duckdb:` (in-memory) connections from one session database.
+
+    Each adapter gets its own cursor on the shared database, so closing it
+    leaves the database open, and the per-invocation in-memory bootstrap is
+    skipped. The database has a `users` table; tests must not write to it.
+    """
+    from dbastion.adapters import duckdb as duckdb_adapter
+
+    real_connect = duckdb_adapter.DuckDBAdapter.connect
+
+    async def _connect(self, config):
+        if config.params.get("path", ":memory:") != ":memory:":
+            return await real_connect(self, config)
+        self._conn = _shared_memory_db.cursor()
+
+    monkeypatch.setattr(duckdb_adapter.DuckDBAdapter, "connect", _connect)
+    return _shared_memory_db
+
+
+async def _dry_run_big(self, sql):
+    from dbastion.adapters._base import CostEstimate, CostUnit
+
+    return CostEstimate(
+        raw_value=100e9, unit=CostUnit.BYTES,
+        estimated_gb=200, summary="200 GB",
+    )
+
+
+async def _dry_run_none(self, sql):
+    return None
+
+
+@pytest.fixture
+def big_estimate(monkeypatch) -> None:
+    """DuckDB dry-runs report 200 GB scanned."""
+    from dbastion.adapters import duckdb as duckdb_adapter
+
+    monkeypatch.setattr(duckdb_adapter.DuckDBAdapter, "dry_run", _dry_run_big)
+
+
+@pytest.fixture
+def no_estimate(monkeypatch) -> None:
+    """DuckDB dry-runs return no estimate."""
+    from dbastion.adapters import duckdb as duckdb_adapter
+
+    monkeypatch.setattr(duckdb_adapter.DuckDBAdapter, "dry_run", _dry_run_none)
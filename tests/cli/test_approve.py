@@ -3,9 +3,7 @@
 from __future__ import annotations
 
 import json
-import tempfile
 
-import duckdb
 from click.testing import CliRunner
 
 from dbastion.cli import main
@@ -117,16 +115,10 @@ class TestApproveExecution:
         assert data["columns"] == ["answer"]
         assert data["rows"] == [{"answer": 42}]
 
-    def test_write_executes(self) -> None:
-        with tempfile.NamedTemporaryFile(suffix=".duckdb", delete=True) as f:
-            db_path = f.name
-        conn = duckdb.connect(db_path)
-        conn.execute("CREATE TABLE t (id INTEGER)")
-        conn.close()
-
+    def test_write_executes(self, duckdb_db, duckdb_mod) -> None:
         envelope = _make_ask_envelope(
-            effective_sql="INSERT INTO t VALUES (1)",
-            db=f"duckdb:path={db_path}",
+            effective_sql="INSERT INTO users VALUES (2, 'bob', true)",
+            db=f"duckdb:path={duckdb_db}",
             classification="dml",
         )
         runner = CliRunner()
@@ -136,10 +128,10 @@ class TestApproveExecution:
         assert data["decision"] == "approved"
 
         # Verify the write actually happened.
-        conn = duckdb.connect(db_path)
-        rows = conn.execute("SELECT * FROM t").fetchall()
+        conn = duckdb_mod.connect(duckdb_db)
+        rows = conn.execute("SELECT id FROM users ORDER BY id").fetchall()
         conn.close()
-        assert rows == [(1,)]
+        assert rows == [(1,), (2,)]
 
     def test_original_sql_preserved_in_output(self) -> None:
         runner = CliRunner()
@@ -166,19 +158,8 @@ class TestApproveExecution:
 class TestApproveEndToEnd:
     """Full pipeline: query → ask → approve → executed."""
 
-    def test_cost_exceeded_then_approve(self, monkeypatch) -> None:
+    def test_cost_exceeded_then_approve(self, big_estimate, monkeypatch) -> None:
         """Simulate: query returns ask (cost exceeded), approve executes."""
-        from dbastion.adapters import duckdb as duckdb_adapter
-        from dbastion.adapters._base import CostEstimate, CostUnit
-
-        async def _dry_run_big(self, sql):
-            return CostEstimate(
-                raw_value=100e9, unit=CostUnit.BYTES,
-                estimated_gb=200, summary="200 GB",
-            )
-
-        monkeypatch.setattr(duckdb_adapter.DuckDBAdapter, "dry_run", _dry_run_big)
-
         runner = CliRunner()
 
         # Step 1: query returns ask
@@ -198,21 +179,14 @@ class TestApproveEndToEnd:
         assert approve_data["columns"] == ["x"]
         assert approve_data["rows"] == [{"x": 1}]
 
-    def test_write_query_then_approve(self) -> None:
+    def test_write_query_then_approve(self, duckdb_db, duckdb_mod) -> None:
         """Write queries return ask from query, then execute via approve."""
-        with tempfile.NamedTemporaryFile(suffix=".duckdb", delete=True) as f:
-            db_path = f.name
-        conn = duckdb.connect(db_path)
-        conn.execute("CREATE TABLE t (id INTEGER, name TEXT)")
-        conn.execute("INSERT INTO t VALUES (1, 'alice')")
-        conn.close()
-
         runner = CliRunner()
-        db = f"duckdb:path={db_path}"
+        db = f"duckdb:path={duckdb_db}"
 
         # Step 1: query returns ask for DML
         query_result = runner.invoke(main, [
-            "query", "DELETE FROM t WHERE id = 1",
+            "query", "DELETE FROM users WHERE id = 1",
             "--db", db, "--format", "json",
         ])
         assert query_result.exit_code == 0
@@ -227,7 +201,7 @@ class TestApproveEndToEnd:
         assert approve_data["decision"] == "approved"
 
         # Verify the delete happened
-        conn = duckdb.connect(db_path)
-        rows = conn.execute("SELECT * FROM t").fetchall()
+        conn = duckdb_mod.connect(duckdb_db)
+        rows = conn.execute("SELECT * FROM users").fetchall()
         conn.close()
         assert rows == []
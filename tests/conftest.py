@@ -5,12 +5,28 @@ from __future__ import annotations
 import os
 
 import pytest
+from click.testing import CliRunner
+
+# Pure-Python suites run first so `pytest -x --ff` fails fast before any
+# database fixtures are built. Unlisted directories run in between.
+_RUN_ORDER = {"policy": 0, "diagnostics": 0, "cli": 2, "adapters": 2}
+
+
+def _run_order(item: pytest.Item) -> int:
+    return _RUN_ORDER.get(item.path.parent.name, 1)
+
+
+@pytest.fixture(scope="session")
+def cli_runner() -> CliRunner:
+    """One CliRunner for the session; each invoke() runs in isolation."""
+    return CliRunner()
 
 
 def pytest_configure(config):
     config.addinivalue_line("markers", "postgres: requires PostgreSQL connection")
     config.addinivalue_line("markers", "clickhouse: requires ClickHouse connection")
     config.addinivalue_line("markers", "snowflake: requires Snowflake connection")
+    config.addinivalue_line("markers", "slow: expensive check, run with DBASTION_TEST_SLOW=1")
 
 
 def pytest_collection_modifyitems(config, items):
@@ -35,3 +51,12 @@ def pytest_collection_modifyitems(config, items):
         for item in items:
             if "snowflake" in item.keywords:
                 item.add_marker(skip_sf)
+
+    if not os.environ.get("DBASTION_TEST_SLOW"):
+        skip_slow = pytest.mark.skip(reason="Slow test (set DBASTION_TEST_SLOW=1)")
+        for item in items:
+            if "slow" in item.keywords:
+                item.add_marker(skip_slow)
+
+    # Stable sort: modules and tests keep their relative order within a tier.
+    items.sort(key=_run_order)
@@ -37,6 +37,25 @@ def test_apply_multiple_fixes():
     assert healed == "SELECT username, email FROM users"
 
 
+def test_apply_many_fixes():
+    sql = ", ".join(["x"] * 1000)
+    diags = [
+        Diagnostic.error(codes.COLUMN_NOT_FOUND, "err").fix("rename", Span(i * 3, i * 3 + 1), "y")
+        for i in range(1000)
+    ]
+
+    healed = apply_fixes(sql, diags)
+    assert healed == ", ".join(["y"] * 1000)
+
+
+def test_apply_insertions_at_same_offset():
+    sql = "SELECT id FROM t"
+    d1 = Diagnostic.error(codes.COLUMN_NOT_FOUND, "err").fix("insert a", Span(7, 7), "a, ")
+    d2 = Diagnostic.error(codes.COLUMN_NOT_FOUND, "err").fix("insert b", Span(7, 7), "b, ")
+
+    assert apply_fixes(sql, [d1, d2]) == "SELECT b, a, id FROM t"
+
+
 def test_no_fixes_returns_none():
     sql = "SELECT id FROM users"
     diag = Diagnostic.warning(
@@ -15,6 +15,11 @@ class TestInjectLimit:
         sql = modified.sql()
         assert "LIMIT" in sql.upper()
 
+    def test_modifies_statement_in_place(self) -> None:
+        stmt = sqlglot.parse_one("SELECT id FROM users")
+        modified, _ = inject_limit(stmt, limit=1000)
+        assert modified is stmt
+
     def test_preserves_existing_limit(self) -> None:
         stmt = sqlglot.parse_one("SELECT id FROM users LIMIT 10")
         modified, diag = inject_limit(stmt, limit=1000)
@@ -85,6 +85,18 @@ class TestCrossJoinNoCondition:
         assert diag is not None
         assert diag.code == codes.CROSS_JOIN_NO_CONDITION
 
+    def test_lowercase_cross_join(self) -> None:
+        sql = "select * from a cross join b"
+        stmt = sqlglot.parse_one(sql)
+        diag = check_cross_join_no_condition(stmt, sql)
+        assert diag is not None
+        assert diag.code == codes.CROSS_JOIN_NO_CONDITION
+
+    def test_lowercase_natural_join_ok(self) -> None:
+        sql = "select * from a natural join b"
+        stmt = sqlglot.parse_one(sql)
+        assert check_cross_join_no_condition(stmt, sql) is None
+
     def test_implicit_cross_join_no_where(self) -> None:
         sql = "SELECT * FROM a, b"
         stmt = sqlglot.parse_one(sql)
@@ -115,11 +127,21 @@ class TestCrossJoinNoCondition:
         stmt = sqlglot.parse_one(sql)
         assert check_cross_join_no_condition(stmt, sql) is None
 
+    def test_link_predicate_inside_function_ok(self) -> None:
+        sql = "SELECT * FROM a, b WHERE lower(a.name) = lower(b.name)"
+        stmt = sqlglot.parse_one(sql)
+        assert check_cross_join_no_condition(stmt, sql) is None
+
     def test_alias_link_predicate_ok(self) -> None:
         sql = "SELECT * FROM a AS x JOIN b AS y WHERE x.id = y.id"
         stmt = sqlglot.parse_one(sql)
         assert check_cross_join_no_condition(stmt, sql) is None
 
+    def test_multi_table_implicit_join_with_links_ok(self) -> None:
+        sql = "SELECT * FROM a, b, c WHERE a.id = b.id AND b.id = c.id"
+        stmt = sqlglot.parse_one(sql)
+        assert check_cross_join_no_condition(stmt, sql) is None
+
     def test_natural_join_ok(self) -> None:
         sql = "SELECT * FROM a NATURAL JOIN b"
         stmt = sqlglot.parse_one(sql)
@@ -1,5 +1,6 @@
 """Test CTE-aware table extraction."""
 
+import pytest
 import sqlglot
 
 from dbastion.policy.tables import extract_tables
@@ -9,40 +10,36 @@ def _parse(sql: str) -> sqlglot.exp.Expression:
     return sqlglot.parse_one(sql)
 
 
-def test_simple_select():
-    assert extract_tables(_parse("SELECT * FROM users")) == ["users"]
-
-
-def test_join():
-    assert extract_tables(_parse("SELECT * FROM users JOIN orders ON 1=1")) == ["orders", "users"]
-
-
-def test_schema_qualified():
-    assert extract_tables(_parse("SELECT * FROM public.users")) == ["public.users"]
-
-
-def test_cte_resolved():
-    sql = "WITH cte AS (SELECT * FROM customers) SELECT * FROM cte"
-    assert extract_tables(_parse(sql)) == ["customers"]
-
-
-def test_nested_ctes():
-    sql = (
-        "WITH a AS (SELECT * FROM raw_events), "
-        "b AS (SELECT * FROM a JOIN users ON 1=1) "
-        "SELECT * FROM b"
-    )
-    assert extract_tables(_parse(sql)) == ["raw_events", "users"]
-
-
-def test_subquery():
-    sql = "SELECT * FROM (SELECT id FROM users) AS sub"
-    assert extract_tables(_parse(sql)) == ["users"]
-
-
-def test_union():
-    sql = "SELECT id FROM users UNION SELECT id FROM customers"
-    assert extract_tables(_parse(sql)) == ["customers", "users"]
+@pytest.mark.parametrize(
+    "sql,expected",
+    [
+        ("SELECT * FROM users", ["users"]),
+        ("SELECT * FROM users JOIN orders ON 1=1", ["orders", "users"]),
+        ("SELECT * FROM public.users", ["public.users"]),
+        # CTE names resolve to their source tables
+        ("WITH cte AS (SELECT * FROM customers) SELECT * FROM cte", ["customers"]),
+        (
+            "WITH a AS (SELECT * FROM raw_events), "
+            "b AS (SELECT * FROM a JOIN users ON 1=1) "
+            "SELECT * FROM b",
+            ["raw_events", "users"],
+        ),
+        ("SELECT * FROM (SELECT id FROM users) AS sub", ["users"]),
+        ("SELECT * FROM users WHERE EXISTS (SELECT 1 FROM orders)", ["orders", "users"]),
+        ("SELECT id FROM users UNION SELECT id FROM customers", ["customers", "users"]),
+        # Table-valued functions are not tables
+        ("SELECT * FROM read_csv('f.csv')", []),
+        ("SELECT * FROM generate_series(1, 10)", []),
+        ("SELECT * FROM users, generate_series(1, 3)", ["users"]),
+        ("WITH s AS (SELECT * FROM generate_series(1, 3)) SELECT * FROM s", []),
+        (
+            "SELECT * FROM users WHERE id IN (SELECT * FROM generate_series(1, 3))",
+            ["users"],
+        ),
+    ],
+)
+def test_extract_tables(sql: str, expected: list[str]) -> None:
+    assert extract_tables(_parse(sql)) == expected
 
 
 def test_insert_includes_target():
@@ -2,37 +2,43 @@
 
 import json
 from datetime import UTC, datetime, timedelta
-from unittest.mock import patch
+from pathlib import Path
+
+import pytest
 
 from dbastion.querylog import _project_slug, cleanup_old_logs, log_query
 
 
-def test_project_slug_encodes_cwd():
-    with patch("dbastion.querylog.os.getcwd", return_value="/Users/bach/projects/dbastion"):
-        slug = _project_slug()
-    assert slug == "Users-bach-projects-dbastion"
+def _today_log(log_dir: Path) -> Path:
+    return log_dir / f"{datetime.now(UTC):%Y-%m-%d}.jsonl"
 
 
-def test_log_query_creates_file(tmp_path):
-    """log_query creates a daily JSONL file and appends an entry."""
-    with patch("dbastion.querylog._LOG_ROOT", tmp_path), patch(
-        "dbastion.querylog.os.getcwd", return_value="/test/project"
-    ):
-        log_query(sql="SELECT 1", effective_sql="SELECT 1 LIMIT 1000", db="duckdb")
+def _read_entries(log_dir: Path) -> list[dict]:
+    return [json.loads(line) for line in _today_log(log_dir).read_bytes().splitlines()]
+
+
+@pytest.fixture
+def log_dir(tmp_path, monkeypatch):
+    """Log root at tmp_path for a cwd of /test/project; returns the project log dir."""
+    monkeypatch.setattr("dbastion.querylog._LOG_ROOT", tmp_path)
+    monkeypatch.setattr("dbastion.querylog.os.getcwd", lambda: "/test/project")
+    return tmp_path / "test-project"
+
+
+def test_project_slug_encodes_cwd(monkeypatch):
+    monkeypatch.setattr("dbastion.querylog.os.getcwd", lambda: "/Users/bach/projects/dbastion")
+    slug = _project_slug()
+    assert slug == "Users-bach-projects-dbastion"
 
-    # Find the created file
-    project_dir = tmp_path / "test-project"
-    assert project_dir.exists()
 
-    log_files = list(project_dir.glob("*.jsonl"))
-    assert len(log_files) == 1
+def test_log_query_creates_file(log_dir):
+    """log_query creates a daily JSONL file and appends an entry."""
+    log_query(sql="SELECT 1", effective_sql="SELECT 1 LIMIT 1000", db="duckdb")
 
-    today = datetime.now(UTC).strftime("%Y-%m-%d")
-    assert log_files[0].name == f"{today}.jsonl"
+    log_file = _today_log(log_dir)
+    assert log_file.exists()
 
-    # Verify content
-    line = log_files[0].read_text().strip()
-    entry = json.loads(line)
+    (entry,) = _read_entries(log_dir)
     assert entry["sql"] == "SELECT 1"
     assert entry["effective_sql"] == "SELECT 1 LIMIT 1000"
     assert entry["db"] == "duckdb"
@@ -40,47 +46,45 @@ def test_log_query_creates_file(tmp_path):
     assert "ts" in entry
 
 
-def test_log_query_appends_to_existing(tmp_path):
+def test_log_query_appends_to_existing(log_dir):
     """Multiple log calls append to the same daily file."""
-    with patch("dbastion.querylog._LOG_ROOT", tmp_path), patch(
-        "dbastion.querylog.os.getcwd", return_value="/test/project"
-    ):
-        log_query(sql="SELECT 1", effective_sql="SELECT 1")
-        log_query(sql="SELECT 2", effective_sql="SELECT 2")
+    log_query(sql="SELECT 1", effective_sql="SELECT 1")
+    log_query(sql="SELECT 2", effective_sql="SELECT 2")
 
-    project_dir = tmp_path / "test-project"
-    log_files = list(project_dir.glob("*.jsonl"))
-    assert len(log_files) == 1
+    entries = _read_entries(log_dir)
+    assert [entry["sql"] for entry in entries] == ["SELECT 1", "SELECT 2"]
 
-    lines = log_files[0].read_text().strip().split("\n")
-    assert len(lines) == 2
-    assert json.loads(lines[0])["sql"] == "SELECT 1"
-    assert json.loads(lines[1])["sql"] == "SELECT 2"
 
+def test_log_query_follows_cwd_change(tmp_path, monkeypatch):
+    """Changing directory mid-process logs under the new project."""
+    monkeypatch.setattr("dbastion.querylog._LOG_ROOT", tmp_path)
+    monkeypatch.setattr("dbastion.querylog.os.getcwd", lambda: "/first/project")
+    log_query(sql="SELECT 1", effective_sql="SELECT 1")
+    monkeypatch.setattr("dbastion.querylog.os.getcwd", lambda: "/second/project")
+    log_query(sql="SELECT 2", effective_sql="SELECT 2")
 
-def test_log_query_full_fields(tmp_path):
+    assert [e["sql"] for e in _read_entries(tmp_path / "first-project")] == ["SELECT 1"]
+    assert [e["sql"] for e in _read_entries(tmp_path / "second-project")] == ["SELECT 2"]
+
+
+def test_log_query_full_fields(log_dir):
     """All fields are recorded when provided."""
-    with patch("dbastion.querylog._LOG_ROOT", tmp_path), patch(
-        "dbastion.querylog.os.getcwd", return_value="/test/project"
-    ):
-        log_query(
-            sql="SELECT * FROM users",
-            effective_sql="SELECT * FROM users LIMIT 1000",
-            db="bigquery:my-project",
-            dialect="bigquery",
-            tables=["users"],
-            blocked=False,
-            diagnostics=["Q0601"],
-            cost_gb=0.5,
-            cost_usd=0.003,
-            duration_ms=450.0,
-            labels={"tool": "dbastion"},
-            dry_run=False,
-        )
-
-    project_dir = tmp_path / "test-project"
-    line = list(project_dir.glob("*.jsonl"))[0].read_text().strip()
-    entry = json.loads(line)
+    log_query(
+        sql="SELECT * FROM users",
+        effective_sql="SELECT * FROM users LIMIT 1000",
+        db="bigquery:my-project",
+        dialect="bigquery",
+        tables=["users"],
+        blocked=False,
+        diagnostics=["Q0601"],
+        cost_gb=0.5,
+        cost_usd=0.003,
+        duration_ms=450.0,
+        labels={"tool": "dbastion"},
+        dry_run=False,
+    )
+
+    (entry,) = _read_entries(log_dir)
     assert entry["tables"] == ["users"]
     assert entry["cost_gb"] == 0.5
     assert entry["cost_usd"] == 0.003
@@ -89,33 +93,71 @@ def test_log_query_full_fields(tmp_path):
     assert entry["dry_run"] is False
 
 
-def test_cleanup_deletes_old_files(tmp_path):
+def test_log_query_write_failure_is_swallowed(tmp_path, monkeypatch):
+    """An unwritable log root drops the entry without raising."""
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    monkeypatch.setattr("dbastion.querylog._LOG_ROOT", blocker)
+    monkeypatch.setattr("dbastion.querylog.os.getcwd", lambda: "/test/project")
+    log_query(sql="SELECT 1", effective_sql="SELECT 1")
+
+    assert blocker.read_text() == ""
+
+
+def test_log_query_missing_cwd_is_swallowed(tmp_path, monkeypatch):
+    """A deleted working directory drops the entry without raising."""
+
+    def _gone() -> str:
+        raise FileNotFoundError("cwd removed")
+
+    monkeypatch.setattr("dbastion.querylog._LOG_ROOT", tmp_path)
+    monkeypatch.setattr("dbastion.querylog.os.getcwd", _gone)
+    log_query(sql="SELECT 1", effective_sql="SELECT 1")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cleanup_deletes_old_files(log_dir):
     """Files older than retention_days are deleted."""
-    project_dir = tmp_path / "test-project"
-    project_dir.mkdir(parents=True)
+    log_dir.mkdir(parents=True)
 
     # Create old file (40 days ago)
     old_date = (datetime.now(UTC) - timedelta(days=40)).strftime("%Y-%m-%d")
-    (project_dir / f"{old_date}.jsonl").write_text('{"sql":"old"}\n')
+    (log_dir / f"{old_date}.jsonl").write_text('{"sql":"old"}\n')
 
     # Create recent file (5 days ago)
     recent_date = (datetime.now(UTC) - timedelta(days=5)).strftime("%Y-%m-%d")
-    (project_dir / f"{recent_date}.jsonl").write_text('{"sql":"recent"}\n')
+    (log_dir / f"{recent_date}.jsonl").write_text('{"sql":"recent"}\n')
 
-    with patch("dbastion.querylog._LOG_ROOT", tmp_path), patch(
-        "dbastion.querylog.os.getcwd", return_value="/test/project"
-    ):
-        deleted = cleanup_old_logs(retention_days=30)
+    deleted = cleanup_old_logs(retention_days=30)
 
     assert deleted == 1
-    assert not (project_dir / f"{old_date}.jsonl").exists()
-    assert (project_dir / f"{recent_date}.jsonl").exists()
+    assert not (log_dir / f"{old_date}.jsonl").exists()
+    assert (log_dir / f"{recent_date}.jsonl").exists()
+
+
+def test_cleanup_ignores_non_date_files(log_dir):
+    """Files that don't look like daily logs are left alone."""
+    log_dir.mkdir(parents=True)
+    (log_dir / "notes.jsonl").write_text("")
+    (log_dir / "2000-01-01.txt").write_text("")
+    (log_dir / "2000-13-45.jsonl").write_text("")
+    (log_dir / "20000101.jsonl").write_text("")
+    (log_dir / "2000-W01-1.jsonl").write_text("")
+
+    deleted = cleanup_old_logs(retention_days=30)
+
+    assert deleted == 0
+    assert (log_dir / "notes.jsonl").exists()
+    assert (log_dir / "2000-01-01.txt").exists()
+    assert (log_dir / "2000-13-45.jsonl").exists()
+    assert (log_dir / "20000101.jsonl").exists()
+    assert (log_dir / "2000-W01-1.jsonl").exists()
 
 
-def test_cleanup_no_directory(tmp_path):
+def test_cleanup_no_directory(tmp_path, monkeypatch):
     """Cleanup is a no-op when log directory doesn't exist."""
-    with patch("dbastion.querylog._LOG_ROOT", tmp_path), patch(
-        "dbastion.querylog.os.getcwd", return_value="/nonexistent/project"
-    ):
-        deleted = cleanup_old_logs()
+    monkeypatch.setattr("dbastion.querylog._LOG_ROOT", tmp_path)
+    monkeypatch.setattr("dbastion.querylog.os.getcwd", lambda: "/nonexistent/project")
+    deleted = cleanup_old_logs()
     assert deleted == 0